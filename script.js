@@ -1,4 +1,5 @@
 const STORAGE_KEY = "focusflow.tasks";
+const SAVE_DELAY_MS = 250;
 
 const root = document.documentElement;
 const taskForm = document.querySelector("[data-task-form]");
@@ -18,6 +19,7 @@ const motionQuery = window.matchMedia("(prefers-reduced-motion: reduce)");
 let tasks = [];
 let currentFilter = "all";
 let partyModeIntervalId = null;
+let saveTimeoutId = null;
 const confettiTimeouts = new Set();
 
 const pointerPosition = { x: 0.5, y: 0.5 };
@@ -40,11 +42,13 @@ const uuid = () =>
     ? crypto.randomUUID()
     : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 8)}`);
 
+const createdAtFormatter = new Intl.DateTimeFormat(undefined, {
+  dateStyle: "medium",
+  timeStyle: "short",
+});
+
 const formatCreatedAt = (timestamp) =>
-  new Intl.DateTimeFormat(undefined, {
-    dateStyle: "medium",
-    timeStyle: "short",
-  }).format(new Date(timestamp));
+  createdAtFormatter.format(new Date(timestamp));
 
 const loadTasks = () => {
   try {
@@ -75,6 +79,18 @@ const saveTasks = () => {
   }
 };
 
+const flushTasks = () => {
+  if (saveTimeoutId === null) return;
+  clearTimeout(saveTimeoutId);
+  saveTimeoutId = null;
+  saveTasks();
+};
+
+const scheduleSave = () => {
+  if (saveTimeoutId !== null) return;
+  saveTimeoutId = setTimeout(flushTasks, SAVE_DELAY_MS);
+};
+
 const setFilter = (filter) => {
   currentFilter = filter;
   filterButtons.forEach((button) => {
@@ -93,7 +109,7 @@ const addTask = (title) => {
     updatedAt: timestamp,
   };
   tasks = [task, ...tasks];
-  saveTasks();
+  scheduleSave();
   renderTasks();
 };
 
@@ -104,13 +120,13 @@ const toggleTask = (taskId) => {
       ? { ...task, completed: !task.completed, updatedAt: timestamp }
       : task
   );
-  saveTasks();
+  scheduleSave();
   renderTasks();
 };
 
 const deleteTask = (taskId) => {
   tasks = tasks.filter((task) => task.id !== taskId);
-  saveTasks();
+  scheduleSave();
   renderTasks();
 };
 
@@ -464,6 +480,13 @@ window.addEventListener("DOMContentLoaded", () => {
   registerTiltMotion(surpriseButton, 10);
 });
 
+window.addEventListener("pagehide", flushTasks);
+document.addEventListener("visibilitychange", () => {
+  if (document.visibilityState === "hidden") {
+    flushTasks();
+  }
+});
+
 surpriseButton?.addEventListener("click", togglePartyMode);
 surpriseClose?.addEventListener("click", exitPartyMode);
 document.addEventListener("keydown", (event) => {